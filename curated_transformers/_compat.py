@@ -1,5 +1,10 @@
 import warnings
 from importlib.util import find_spec
+from typing import Callable, TypeVar
+
+import torch
+
+FuncT = TypeVar("FuncT", bound=Callable)
 
 _has_scipy = find_spec("scipy") is not None and find_spec("scipy.stats") is not None
 has_bitsandbytes = find_spec("bitsandbytes") is not None
@@ -16,3 +21,40 @@ if has_bitsandbytes and not _has_scipy:
     has_bitsandbytes = False
 
 has_safetensors = find_spec("safetensors")
+
+# torch.compile is not supported on all Python versions and platforms.
+# We only check for the presence of the API here. Probing deeper would
+# require importing `torch._dynamo`, which is far too expensive to do at
+# import time. Unsupported configurations raise when compilation is
+# attempted.
+has_torch_compile = hasattr(torch, "compile")
+
+
+def torch_assume_constant_result(func: FuncT) -> FuncT:
+    """
+    Mark a function so that Dynamo evaluates it at trace time and treats
+    its result as a constant.
+
+    This is equivalent to ``torch._dynamo.assume_constant_result``, except
+    that it does not import ``torch._dynamo`` (which is expensive) when the
+    function is marked.
+
+    :param func:
+        The function to mark.
+    :returns:
+        The marked function.
+    """
+    if has_torch_compile:
+        func._dynamo_marked_constant = True  # type: ignore[attr-defined]
+    return func
+
+
+try:
+    is_torch_compiling = torch.compiler.is_compiling
+except AttributeError:
+    try:
+        is_torch_compiling = torch._dynamo.is_compiling
+    except AttributeError:
+
+        def is_torch_compiling() -> bool:
+            return False
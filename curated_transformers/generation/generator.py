@@ -1,10 +1,11 @@
-from typing import Any, Generic, Iterator, List, Optional, Tuple
+from typing import Any, Generic, Iterator, List, Optional, Tuple, cast
 
 import torch
 from torch import Tensor
 from torch.distributions import Categorical
 
 from ..layers.attention import AttentionMask
+from ..layers.cache import KeyValueCache, PagedKeyValueCache
 from ..models.module import CausalLMModule
 from ..models.output import CacheT, CausalLMOutputWithCache
 from .config import GeneratorConfig, GreedyGeneratorConfig, SampleGeneratorConfig
@@ -102,11 +103,32 @@ class Generator(Generic[CacheT]):
                     attention_mask=state.attention_mask,
                     cache=state.cache,
                     store_cache=True,
+                    store_hidden_states=False,
                     positions=state.positions,
+                    last_step_logits_only=True,
+                )
+
+            new_cache = output.cache
+            if state.cache is None and new_cache is not None:
+                # After prefill, convert the dense per-layer caches into
+                # paged caches, so that decoding steps append to the cache
+                # in-place rather than reallocating it.
+                new_cache = cast(
+                    List[CacheT],
+                    [
+                        (
+                            PagedKeyValueCache.from_key_value(
+                                layer_cache.key, layer_cache.value
+                            )
+                            if type(layer_cache) is KeyValueCache
+                            else layer_cache
+                        )
+                        for layer_cache in new_cache
+                    ],
                 )
 
             seq_ids, last_step_ids = state.step(
-                cache=output.cache,
+                cache=new_cache,
                 predicted_ids=generation_step(logits_transform, output),
                 stop_condition=stop_condition,
             )
@@ -11,8 +11,9 @@ from .attention import (
     SelfAttention,
     enable_torch_sdp,
 )
-from .cache import CacheProtocol, KeyValueCache
+from .cache import CacheProtocol, KeyValueCache, PagedKeyValueCache
 from .embeddings import (
+    QuantizedEmbedding,
     QueryKeyRotaryEmbeddings,
     RotaryEmbeddings,
     SinusoidalPositionalEmbedding,
@@ -42,9 +43,11 @@ __all__ = [
     "GELUFast",
     "GELUNew",
     "KeyValueCache",
+    "PagedKeyValueCache",
     "PointwiseFeedForward",
     "QkvMode",
     "QkvSplit",
+    "QuantizedEmbedding",
     "QueryKeyRotaryEmbeddings",
     "RMSNorm",
     "RotaryEmbeddings",
@@ -4,6 +4,7 @@ from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, Type, Union
 
 import torch
@@ -11,6 +12,7 @@ import torch.nn.functional as F
 from torch import Tensor
 from torch.nn import Dropout, Linear, Module
 
+from .._compat import is_torch_compiling, torch_assume_constant_result
 from ..semver import Default, FutureMandatory
 from ..util.dataclass import DataclassAsDict
 from .cache import KeyValueCache
@@ -19,6 +21,14 @@ from .embeddings import QueryKeyRotaryEmbeddings
 _TORCH_SDP: ContextVar[bool] = ContextVar("torch_sdp", default=False)
 
 
+# Dynamo cannot trace through a `ContextVar` read. Read the value at
+# trace time instead, so that the attention scorer can be part of a
+# `fullgraph` compiled region.
+@torch_assume_constant_result
+def _torch_sdp_enabled() -> bool:
+    return _TORCH_SDP.get()
+
+
 @contextmanager
 def enable_torch_sdp(use_torch_sdp: bool = True):
     """
@@ -172,12 +182,112 @@ class AttentionMask(DataclassAsDict):
         result in (near-)zero probabilities for the elements that
         are ``False``.
 
+        The logit mask is computed once per ``dtype`` and memoized, so
+        that all hidden layers share the same mask tensor.
+
         :param dtype:
             Data type of the logit mask.
         :returns:
             Logit mask.
         """
-        return (1.0 - self.bool_mask.to(dtype)) * torch.finfo(dtype).min
+        if is_torch_compiling():
+            # The compiler already eliminates the recomputation across
+            # layers and cannot trace through the memo dict.
+            return self._compute_logit_mask(dtype)
+
+        # Store the memo dict through `object` to keep it out of the
+        # dict representation of the mask.
+        try:
+            logit_masks = object.__getattribute__(self, "_logit_masks")
+        except AttributeError:
+            logit_masks = {}
+            object.__setattr__(self, "_logit_masks", logit_masks)
+
+        logit_mask = logit_masks.get(dtype)
+        if logit_mask is None:
+            logit_mask = self._compute_logit_mask(dtype)
+            logit_masks[dtype] = logit_mask
+
+        return logit_mask
+
+    def _compute_logit_mask(self, dtype: torch.dtype) -> Tensor:
+        # Select between zero and the blocked value directly, rather than
+        # computing the mask arithmetically from a dtype conversion of the
+        # boolean mask, which would take multiple full-tensor operations.
+        zero = self.bool_mask.new_zeros((), dtype=dtype)
+        blocked_value = self.bool_mask.new_full((), torch.finfo(dtype).min, dtype=dtype)
+        return torch.where(self.bool_mask, zero, blocked_value)
+
+    def all_true(self) -> bool:
+        """
+        Check whether all mask elements are ``True``. Masks without
+        masked-out elements do not have to be applied, allowing attention
+        implementations to take faster paths.
+
+        The check requires a device synchronization, so the result is
+        memoized. ``False`` is returned while tracing or compiling, since
+        the result would be baked into the graph as a constant.
+
+        :returns:
+            Whether all mask elements are ``True``.
+        """
+        if is_torch_compiling() or torch.jit.is_tracing():
+            return False
+
+        # Store the memo through `object` to keep it out of the dict
+        # representation of the mask.
+        try:
+            return object.__getattribute__(self, "_all_true")
+        except AttributeError:
+            all_true = bool(self.bool_mask.all())
+            object.__setattr__(self, "_all_true", all_true)
+            return all_true
+
+    def merged_causal_mask(self, query: Tensor, key: Tensor) -> "AttentionMask":
+        """
+        Merge this attention mask with a causal mask for the given query
+        and key.
+
+        The merged mask is memoized by query and key length, so that all
+        hidden layers share the same merged mask tensor.
+
+        :param query:
+            Query to compute the causal mask for.
+
+            *Shape:* ``(batch_size, heads, query_len, head_width)``
+        :param key:
+            Key to compute the causal mask for.
+
+            *Shape:* ``(batch_size, heads, key_len, head_width)``
+        :returns:
+            Merged mask.
+        """
+        if is_torch_compiling():
+            # The compiler already eliminates the recomputation across
+            # layers and cannot trace through the memo dict.
+            return self.merge_mask(create_causal_mask(query, key))
+
+        # Store the memo dict through `object` to keep it out of the
+        # dict representation of the mask.
+        try:
+            merged_masks = object.__getattribute__(self, "_merged_causal_masks")
+        except AttributeError:
+            merged_masks = {}
+            object.__setattr__(self, "_merged_causal_masks", merged_masks)
+
+        key_shape = (query.size(2), key.size(2))
+        merged_mask = merged_masks.get(key_shape)
+        if merged_mask is None:
+            if self.all_true():
+                # A mask without masked-out elements does not restrict the
+                # causal mask, so merging would only broadcast the causal
+                # mask over the batch.
+                merged_mask = create_causal_mask(query, key)
+            else:
+                merged_mask = self.merge_mask(create_causal_mask(query, key))
+            merged_masks[key_shape] = merged_mask
+
+        return merged_mask
 
     def extend_length(self, count: int, fill_value: bool) -> "AttentionMask":
         """
@@ -504,6 +614,27 @@ class QkvMode(Enum):
     MERGED_SPLIT_AFTER = 2
 
 
+def _alibi_distances(
+    seq_len: int, is_causal: bool, invert: bool, device: torch.device
+) -> Tensor:
+    # Compute the distances on the target device, so that no intermediate
+    # tensor has to be copied from the host to the device.
+    if is_causal:
+        distances = torch.arange(1 - seq_len, 1, device=device)
+    else:
+        positions = torch.arange(seq_len, device=device)
+        distances = positions - positions.view(-1, 1)
+        distances = distances.abs().mul(-1).view(1, 1, seq_len, seq_len)
+
+    if invert:
+        distances += seq_len - 1
+
+    return distances
+
+
+_alibi_distances_memoized = lru_cache(maxsize=8)(_alibi_distances)
+
+
 class AttentionLinearBiases(Module):
     """
     ALiBi: Linear biases for attention (`Press et al., 2022`_).
@@ -598,16 +729,18 @@ class AttentionLinearBiases(Module):
 
         :meta private:
         """
-        if self.is_causal:
-            distances = torch.arange(1 - seq_len, 1)
+        if is_torch_compiling():
+            distances = _alibi_distances(
+                seq_len, self.is_causal, self.invert, self.slopes.device
+            )
         else:
-            distances = torch.arange(seq_len) - torch.arange(seq_len).view(-1, 1)
-            distances = distances.abs().mul(-1).view(1, 1, seq_len, seq_len)
-
-        if self.invert:
-            distances += seq_len - 1
+            # The distances only depend on the sequence length, so they are
+            # shared by all attention layers.
+            distances = _alibi_distances_memoized(
+                seq_len, self.is_causal, self.invert, self.slopes.device
+            )
 
-        return distances.to(self.slopes.device) * self.slopes
+        return distances * self.slopes
 
     def forward(self, *, attention_scores: Tensor, inplace: bool = True) -> Tensor:
         """
@@ -713,16 +846,27 @@ class ScaledDotProductAttention(AttentionScorer):
         value: Tensor,
         attention_mask: AttentionMask,
     ) -> Tensor:
-        if _TORCH_SDP.get():
-            attn_mask = attention_mask.logit_mask(query.dtype)
-
-            # Add AliBi to the logit mask
-            if self.linear_biases is not None:
-                biases = self.linear_biases.calculate_biases(key.size(-2)).to(
-                    dtype=query.dtype, device=query.device
-                )
-                bool_mask = attention_mask.bool_mask
-                attn_mask = torch.where(bool_mask, biases, attn_mask)
+        # A mask without masked-out elements does not have to be applied.
+        # This also allows Torch SDP to use its fastest (unmasked) kernels.
+        skip_mask = attention_mask.all_true()
+
+        if _torch_sdp_enabled():
+            if skip_mask:
+                attn_mask = None
+                if self.linear_biases is not None:
+                    attn_mask = self.linear_biases.calculate_biases(key.size(-2)).to(
+                        dtype=query.dtype, device=query.device
+                    )
+            else:
+                attn_mask = attention_mask.logit_mask(query.dtype)
+
+                # Add AliBi to the logit mask
+                if self.linear_biases is not None:
+                    biases = self.linear_biases.calculate_biases(key.size(-2)).to(
+                        dtype=query.dtype, device=query.device
+                    )
+                    bool_mask = attention_mask.bool_mask
+                    attn_mask = torch.where(bool_mask, biases, attn_mask)
 
             # We can't pass a bool mask, because it is currently broken:
             # https://github.com/pytorch/pytorch/issues/103749
@@ -741,7 +885,8 @@ class ScaledDotProductAttention(AttentionScorer):
             if self.linear_biases is not None:
                 attn_scores = self.linear_biases(attention_scores=attn_scores)
 
-            attn_scores = attention_mask.apply_logit_mask(attn_scores)
+            if not skip_mask:
+                attn_scores = attention_mask.apply_logit_mask(attn_scores)
             attn_weights = attn_scores.softmax(dim=-1)
             attn_values = self.dropout(attn_weights @ value)
 
@@ -897,16 +1042,13 @@ class SelfAttention(Module):
         # KeyValueCache to get validation and utility methods.
         cache = KeyValueCache.jit_rewrap(cache)
         if cache is not None:
-            cache_k = cache.key
-            cache_v = cache.value
-
-            key = torch.cat([cache_k, key], dim=-2)
-            value = torch.cat([cache_v, value], dim=-2)
+            cache = cache.append(key, value)
+            key = cache.key
+            value = cache.value
 
         combined_mask = attention_mask
         if use_causal_mask:
-            causal_mask = create_causal_mask(query, key)
-            combined_mask = combined_mask.merge_mask(causal_mask)
+            combined_mask = combined_mask.merged_causal_mask(query, key)
 
         attn = self.attention_scorer(
             query=query,
@@ -920,7 +1062,9 @@ class SelfAttention(Module):
         output = self.output(attn)
 
         if store_cache:
-            return output, KeyValueCache(key, value)
+            if cache is None:
+                cache = KeyValueCache(key, value)
+            return output, cache
         else:
             return output, None
 
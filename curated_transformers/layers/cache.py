@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass
 from typing import Optional, Protocol, Tuple, Type, TypeVar, Union
 
@@ -8,6 +9,9 @@ from ..util.dataclass import DataclassAsTuple
 
 CacheProtocolSelf = TypeVar("CacheProtocolSelf", bound="CacheProtocol")
 
+# Number of sequence steps per allocated cache block.
+_CACHE_BLOCK_SIZE = 16
+
 
 class CacheProtocol(Protocol):
     def filter_batch_items(self: CacheProtocolSelf, mask: Tensor) -> CacheProtocolSelf:
@@ -26,6 +30,17 @@ class CacheProtocol(Protocol):
         ...
 
 
+def _validate_cache_mask(mask: Tensor, batch_size: int) -> None:
+    if mask.ndim != 1:
+        raise ValueError(f"Cache mask must be a 1D tensor, has {mask.ndim} dimensions.")
+    if mask.size(0) != batch_size:
+        raise ValueError(
+            f"Cache mask size ({mask.size(0)}) must match cache batch size ({batch_size})."
+        )
+    if mask.dtype != torch.bool:
+        raise ValueError(f"Cache mask dtype must be bool, was: {mask.dtype}.")
+
+
 @dataclass
 class KeyValueCache(DataclassAsTuple):
     """
@@ -40,18 +55,28 @@ class KeyValueCache(DataclassAsTuple):
     key: Tensor
     value: Tensor
 
-    def filter_batch_items(self, mask: Tensor) -> "KeyValueCache":
-        if mask.ndim != 1:
-            raise ValueError(
-                f"Cache mask must be a 1D tensor, has {mask.ndim} dimensions."
-            )
-        if mask.size(0) != self.key.size(0):
-            raise ValueError(
-                f"Cache mask size ({mask.size(0)}) must match cache batch size ({self.key.size(0)})."
-            )
-        if mask.dtype != torch.bool:
-            raise ValueError(f"Cache mask dtype must be bool, was: {mask.dtype}.")
+    def append(self, key: Tensor, value: Tensor) -> "KeyValueCache":
+        """
+        Append new key/value representations to the cache.
+
+        :param key:
+            Key representations to append.
 
+            *Shape:* ``(batch_size, n_heads, seq_len, width_per_head)``
+        :param value:
+            Value representations to append.
+
+            *Shape:* ``(batch_size, n_heads, seq_len, width_per_head)``
+        :returns:
+            Cache with the appended representations.
+        """
+        return KeyValueCache(
+            torch.cat([self.key, key], dim=-2),
+            torch.cat([self.value, value], dim=-2),
+        )
+
+    def filter_batch_items(self, mask: Tensor) -> "KeyValueCache":
+        _validate_cache_mask(mask, self.key.size(0))
         return KeyValueCache(self.key[mask], self.value[mask])
 
     @classmethod
@@ -90,3 +115,114 @@ class KeyValueCache(DataclassAsTuple):
             )
 
         return cls(key_cache, value_cache)
+
+
+@dataclass
+class PagedKeyValueCache(KeyValueCache):
+    """
+    Key-value cache that stores keys and values in buffers that are
+    allocated in fixed-size blocks of sequence steps.
+
+    Appending to this cache writes into the last partially-filled block
+    and only allocates new blocks when the buffers have run out of
+    capacity. This avoids reallocating and copying the full cache on
+    every decoding step, as :class:`.KeyValueCache` does.
+
+    Since appending writes into the buffers in-place, this cache should
+    only be used during inference.
+
+    :param key:
+        Key. View of ``key_blocks``, sized to the current cache length.
+    :param value:
+        Value. View of ``value_blocks``, sized to the current cache length.
+    :param key_blocks:
+        Block-padded buffer storing the keys.
+    :param value_blocks:
+        Block-padded buffer storing the values.
+    """
+
+    key_blocks: Tensor
+    value_blocks: Tensor
+
+    @classmethod
+    def from_key_value(
+        cls: Type["PagedKeyValueCache"], key: Tensor, value: Tensor
+    ) -> "PagedKeyValueCache":
+        """
+        Create a paged cache from dense key/value representations.
+
+        :param key:
+            Key representations.
+
+            *Shape:* ``(batch_size, n_heads, seq_len, width_per_head)``
+        :param value:
+            Value representations.
+
+            *Shape:* ``(batch_size, n_heads, seq_len, width_per_head)``
+        :returns:
+            Paged cache holding the representations.
+        """
+        if key.shape != value.shape:
+            raise ValueError(
+                f"Key ({key.shape}) and value ({value.shape}) must have same shapes."
+            )
+
+        seq_len = key.size(-2)
+        capacity = math.ceil(seq_len / _CACHE_BLOCK_SIZE) * _CACHE_BLOCK_SIZE
+        key_blocks = _blocks_for(key, capacity)
+        value_blocks = _blocks_for(value, capacity)
+        key_blocks[:, :, :seq_len, :] = key
+        value_blocks[:, :, :seq_len, :] = value
+
+        return cls(
+            key_blocks[:, :, :seq_len, :],
+            value_blocks[:, :, :seq_len, :],
+            key_blocks,
+            value_blocks,
+        )
+
+    def append(self, key: Tensor, value: Tensor) -> "PagedKeyValueCache":
+        cache_len = self.key.size(-2)
+        new_len = cache_len + key.size(-2)
+
+        key_blocks = self.key_blocks
+        value_blocks = self.value_blocks
+        if new_len > key_blocks.size(-2):
+            # Out of capacity, extend the buffers to the next block
+            # boundary that fits the new length.
+            capacity = math.ceil(new_len / _CACHE_BLOCK_SIZE) * _CACHE_BLOCK_SIZE
+            new_key_blocks = _blocks_for(key, capacity)
+            new_value_blocks = _blocks_for(value, capacity)
+            new_key_blocks[:, :, :cache_len, :] = key_blocks[:, :, :cache_len, :]
+            new_value_blocks[:, :, :cache_len, :] = value_blocks[:, :, :cache_len, :]
+            key_blocks = new_key_blocks
+            value_blocks = new_value_blocks
+
+        key_blocks[:, :, cache_len:new_len, :] = key
+        value_blocks[:, :, cache_len:new_len, :] = value
+
+        return PagedKeyValueCache(
+            key_blocks[:, :, :new_len, :],
+            value_blocks[:, :, :new_len, :],
+            key_blocks,
+            value_blocks,
+        )
+
+    def filter_batch_items(self, mask: Tensor) -> "PagedKeyValueCache":
+        _validate_cache_mask(mask, self.key.size(0))
+
+        cache_len = self.key.size(-2)
+        key_blocks = self.key_blocks[mask]
+        value_blocks = self.value_blocks[mask]
+
+        return PagedKeyValueCache(
+            key_blocks[:, :, :cache_len, :],
+            value_blocks[:, :, :cache_len, :],
+            key_blocks,
+            value_blocks,
+        )
+
+
+def _blocks_for(kv: Tensor, capacity: int) -> Tensor:
+    batch_size, n_heads, _, width = kv.shape
+    return kv.new_empty((batch_size, n_heads, capacity, width))
@@ -81,6 +81,45 @@ class PointwiseFeedForward(Module):
             intermediate_width, hidden_width, bias=use_bias, device=device
         )
         self.activation = activation
+        self._gate_fused = False
+
+    def fuse_gate(self) -> None:
+        """
+        Fuse the gate and intermediate projections into a single
+        projection.
+
+        The gated transformation projects the same input twice, each
+        projection launched as a separate matmul. Fusing them computes
+        both projections with a single matmul over the concatenated
+        weights, which is faster when the batch and sequence dimensions
+        are small (such as during generation).
+
+        Fusing changes the parameter layout of the layer, so it should
+        only be applied after loading the parameters and before
+        inference.
+        """
+        if self.gate is None:
+            raise ValueError(
+                "Cannot fuse the gate of a feed-forward layer without gating"
+            )
+
+        gate = self.gate
+        intermediate = self.intermediate
+        fused = Linear(
+            gate.in_features,
+            gate.out_features + intermediate.out_features,
+            bias=gate.bias is not None,
+            device=gate.weight.device,
+            dtype=gate.weight.dtype,
+        )
+        with torch.no_grad():
+            fused.weight.copy_(torch.cat([gate.weight, intermediate.weight], dim=0))
+            if fused.bias is not None:
+                fused.bias.copy_(torch.cat([gate.bias, intermediate.bias], dim=0))
+
+        self.intermediate = fused
+        self.gate = None
+        self._gate_fused = True
 
     def forward(self, input: Tensor) -> Tensor:
         """
@@ -95,7 +134,10 @@ class PointwiseFeedForward(Module):
 
             *Shape:* ``(batch_size, seq_len, width)``
         """
-        if self.gate is None:
+        if self._gate_fused:
+            gate_out, intermediate_out = self.intermediate(input).chunk(2, dim=-1)
+            return self.output(self.activation(gate_out) * intermediate_out)
+        elif self.gate is None:
             return self.output(self.activation(self.intermediate(input)))
         else:
             return self.output(
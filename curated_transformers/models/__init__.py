@@ -1,64 +1,75 @@
-from .albert import ALBERTConfig, ALBERTEncoder
-from .auto_model import AutoCausalLM, AutoDecoder, AutoEncoder
-from .bert import BERTConfig, BERTEncoder
-from .camembert import CamemBERTEncoder
-from .config import (
-    RotaryEmbeddingConfig,
-    TransformerAttentionLayerConfig,
-    TransformerConfig,
-    TransformerEmbeddingLayerConfig,
-    TransformerFeedForwardLayerConfig,
-    TransformerLayerConfig,
-)
-from .falcon import FalconCausalLM, FalconConfig, FalconDecoder
-from .gpt_neox import GPTNeoXCausalLM, GPTNeoXConfig, GPTNeoXDecoder
-from .hf_hub import FromHFHub
-from .llama import LlamaCausalLM, LlamaConfig, LlamaDecoder
-from .module import CausalLMModule, DecoderModule, EncoderModule
-from .mpt import MPTCausalLM, MPTConfig, MPTDecoder
-from .output import CausalLMOutputWithCache, ModelOutput, ModelOutputWithCache
-from .roberta import RoBERTaConfig, RoBERTaEncoder
-from .transformer import TransformerCausalLM, TransformerDecoder, TransformerEncoder
-from .xlm_roberta import XLMREncoder
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
-    "ALBERTConfig",
-    "ALBERTEncoder",
-    "AutoCausalLM",
-    "AutoDecoder",
-    "AutoEncoder",
-    "BERTConfig",
-    "BERTEncoder",
-    "CamemBERTEncoder",
-    "CausalLMModule",
-    "CausalLMOutputWithCache",
-    "DecoderModule",
-    "EncoderModule",
-    "FalconCausalLM",
-    "FalconConfig",
-    "FalconDecoder",
-    "FromHFHub",
-    "GPTNeoXCausalLM",
-    "GPTNeoXConfig",
-    "GPTNeoXDecoder",
-    "LlamaCausalLM",
-    "LlamaConfig",
-    "LlamaDecoder",
-    "MPTCausalLM",
-    "MPTConfig",
-    "MPTDecoder",
-    "ModelOutput",
-    "ModelOutputWithCache",
-    "RoBERTaConfig",
-    "RoBERTaEncoder",
-    "RotaryEmbeddingConfig",
-    "TransformerAttentionLayerConfig",
-    "TransformerConfig",
-    "TransformerCausalLM",
-    "TransformerDecoder",
-    "TransformerEmbeddingLayerConfig",
-    "TransformerEncoder",
-    "TransformerFeedForwardLayerConfig",
-    "TransformerLayerConfig",
-    "XLMREncoder",
-]
+if TYPE_CHECKING:
+    from .albert import ALBERTConfig, ALBERTEncoder
+    from .auto_model import AutoCausalLM, AutoDecoder, AutoEncoder
+    from .bert import BERTConfig, BERTEncoder
+    from .camembert import CamemBERTEncoder
+    from .config import (
+        RotaryEmbeddingConfig,
+        TransformerAttentionLayerConfig,
+        TransformerConfig,
+        TransformerEmbeddingLayerConfig,
+        TransformerFeedForwardLayerConfig,
+        TransformerLayerConfig,
+    )
+    from .falcon import FalconCausalLM, FalconConfig, FalconDecoder
+    from .gpt_neox import GPTNeoXCausalLM, GPTNeoXConfig, GPTNeoXDecoder
+    from .hf_hub import FromHFHub
+    from .llama import LlamaCausalLM, LlamaConfig, LlamaDecoder
+    from .module import CausalLMModule, DecoderModule, EncoderModule
+    from .mpt import MPTCausalLM, MPTConfig, MPTDecoder
+    from .output import CausalLMOutputWithCache, ModelOutput, ModelOutputWithCache
+    from .roberta import RoBERTaConfig, RoBERTaEncoder
+    from .transformer import TransformerCausalLM, TransformerDecoder, TransformerEncoder
+    from .xlm_roberta import XLMREncoder
+
+# The re-exported classes are imported lazily (PEP 562). Importing all
+# model architectures eagerly is costly, whereas most applications only
+# use one architecture or only need the auto-model classes.
+_IMPORT_STRUCTURE = {
+    "albert": ["ALBERTConfig", "ALBERTEncoder"],
+    "auto_model": ["AutoCausalLM", "AutoDecoder", "AutoEncoder"],
+    "bert": ["BERTConfig", "BERTEncoder"],
+    "camembert": ["CamemBERTEncoder"],
+    "config": [
+        "RotaryEmbeddingConfig",
+        "TransformerAttentionLayerConfig",
+        "TransformerConfig",
+        "TransformerEmbeddingLayerConfig",
+        "TransformerFeedForwardLayerConfig",
+        "TransformerLayerConfig",
+    ],
+    "falcon": ["FalconCausalLM", "FalconConfig", "FalconDecoder"],
+    "gpt_neox": ["GPTNeoXCausalLM", "GPTNeoXConfig", "GPTNeoXDecoder"],
+    "hf_hub": ["FromHFHub"],
+    "llama": ["LlamaCausalLM", "LlamaConfig", "LlamaDecoder"],
+    "module": ["CausalLMModule", "DecoderModule", "EncoderModule"],
+    "mpt": ["MPTCausalLM", "MPTConfig", "MPTDecoder"],
+    "output": ["CausalLMOutputWithCache", "ModelOutput", "ModelOutputWithCache"],
+    "roberta": ["RoBERTaConfig", "RoBERTaEncoder"],
+    "transformer": ["TransformerCausalLM", "TransformerDecoder", "TransformerEncoder"],
+    "xlm_roberta": ["XLMREncoder"],
+}
+
+_MODULE_BY_ATTR = {
+    attr: module for module, attrs in _IMPORT_STRUCTURE.items() for attr in attrs
+}
+
+__all__ = sorted(_MODULE_BY_ATTR)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULE_BY_ATTR.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache the attribute, so that subsequent lookups do not go through
+    # this function again.
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return __all__
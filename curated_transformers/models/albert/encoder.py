@@ -85,6 +85,7 @@ class ALBERTEncoder(EncoderModule[ALBERTConfig], FromHFHub[ALBERTConfig]):
         *,
         type_ids: Optional[Tensor] = None,
         positions: Optional[Tensor] = None,
+        store_hidden_states: bool = True,
     ) -> ModelOutput:
         embeddings = self.embeddings(piece_ids, positions=positions, type_ids=type_ids)
         layer_output = embeddings
@@ -95,7 +96,11 @@ class ALBERTEncoder(EncoderModule[ALBERTConfig], FromHFHub[ALBERTConfig]):
         for group in self.groups:
             for _ in range(layers_per_group):
                 layer_output, _ = group(layer_output, attention_mask=attention_mask)
-                layer_outputs.append(layer_output)
+                if store_hidden_states:
+                    layer_outputs.append(layer_output)
+
+        if not store_hidden_states:
+            layer_outputs = [layer_output]
 
         return ModelOutput(all_outputs=[embeddings, *layer_outputs])
 
@@ -1,6 +1,6 @@
 import warnings
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, Type, TypeVar
+from typing import Dict, Generic, Optional, Tuple, Type, TypeVar
 
 import torch
 from catalogue import Registry
@@ -19,6 +19,11 @@ from .module import CausalLMModule, DecoderModule, EncoderModule, TransformerMod
 
 ModelT = TypeVar("ModelT")
 
+# Resolved model classes, keyed by auto-model class and model type. Avoids
+# re-scanning the registry entry points when the same model type is loaded
+# repeatedly.
+_resolved_model_cls_cache: Dict[Tuple[type, str], Type[FromHFHub]] = {}
+
 
 class AutoModel(ABC, Generic[ModelT]):
     """
@@ -36,6 +41,12 @@ class AutoModel(ABC, Generic[ModelT]):
     ) -> Type[FromHFHub]:
         config = repo.model_config()
 
+        model_type = config.get("model_type")
+        if model_type is not None:
+            cached_cls = _resolved_model_cls_cache.get((cls, model_type))
+            if cached_cls is not None:
+                return cached_cls
+
         for entrypoint, module_cls in cls._registry.get_entry_points().items():
             if not issubclass(module_cls, FromHFHub):
                 warnings.warn(
@@ -53,6 +64,8 @@ class AutoModel(ABC, Generic[ModelT]):
                 continue
 
             if module_cls.is_supported(config):
+                if model_type is not None:
+                    _resolved_model_cls_cache[(cls, model_type)] = module_cls
                 return module_cls
 
         entrypoints = {
@@ -71,9 +84,12 @@ class AutoModel(ABC, Generic[ModelT]):
         device: Optional[torch.device],
         quantization_config: Optional[BitsAndBytesConfig],
     ) -> FromHFHub:
-        module_cls = cls._resolve_model_cls(ModelRepository(repo))
+        model_repo = ModelRepository(repo)
+        module_cls = cls._resolve_model_cls(model_repo)
+        # Pass the wrapped repository along, so that the model config
+        # fetched during resolution is reused when loading the model.
         module = module_cls.from_repo(
-            repo=repo,
+            repo=model_repo,
             device=device,
             quantization_config=quantization_config,
         )
@@ -48,6 +48,8 @@ class CausalLMModule(Generic[ConfigT, CacheT], TransformerModule[ConfigT]):
         cache: Optional[List[CacheT]] = None,
         positions: Optional[Tensor] = None,
         store_cache: bool = False,
+        store_hidden_states: bool = True,
+        last_step_logits_only: bool = False,
     ) -> CausalLMOutputWithCache[CacheT]:
         """
         Apply the causal language model to the given piece identifiers.
@@ -71,6 +73,17 @@ class CausalLMModule(Generic[ConfigT, CacheT], TransformerModule[ConfigT]):
             *Shape:* ``(batch_size, seq_len)``
         :param store_cache:
             Whether to cache the key/value representations for future reuse.
+        :param store_hidden_states:
+            Whether to keep the hidden states of all layers in the
+            output. When disabled, the output only contains the
+            embedding layer output and the state of the last hidden
+            layer, saving memory when the intermediate states are not
+            needed.
+        :param last_step_logits_only:
+            Only compute the logits of the last step. This avoids
+            materializing the full ``(batch_size, seq_len, n_pieces)``
+            logits tensor when only the logits of the last step are
+            needed, such as during generation.
         :returns:
             Causal language model output with key/value cache.
         """
@@ -94,6 +107,7 @@ class DecoderModule(Generic[ConfigT, CacheT], TransformerModule[ConfigT]):
         cache: Optional[List[CacheT]] = None,
         positions: Optional[Tensor] = None,
         store_cache: bool = False,
+        store_hidden_states: bool = True,
     ) -> ModelOutputWithCache[CacheT]:
         """
         Apply the decoder to the given piece identifiers.
@@ -117,6 +131,12 @@ class DecoderModule(Generic[ConfigT, CacheT], TransformerModule[ConfigT]):
             *Shape:* ``(batch_size, seq_len)``
         :param store_cache:
             Whether to cache the key/value representations for future reuse.
+        :param store_hidden_states:
+            Whether to keep the hidden states of all layers in the
+            output. When disabled, the output only contains the
+            embedding layer output and the state of the last hidden
+            layer, saving memory when the intermediate states are not
+            needed.
         :returns:
             Decoder output with key/value cache.
         """
@@ -139,6 +159,7 @@ class EncoderModule(Generic[ConfigT], TransformerModule[ConfigT]):
         *,
         positions: Optional[Tensor] = None,
         type_ids: Optional[Tensor] = None,
+        store_hidden_states: bool = True,
     ) -> ModelOutput:
         """
         Apply the encoder to the input.
@@ -163,6 +184,12 @@ class EncoderModule(Generic[ConfigT], TransformerModule[ConfigT]):
             sequence classification and question answering.
 
             *Shape:* ``(batch_size, seq_len)``
+        :param store_hidden_states:
+            Whether to keep the hidden states of all layers in the
+            output. When disabled, the output only contains the
+            embedding layer output and the state of the last hidden
+            layer, saving memory when the intermediate states are not
+            needed.
         :returns:
             Encoder output.
         """
@@ -63,6 +63,8 @@ class MPTCausalLM(TransformerCausalLM[MPTConfig], FromHFHub[MPTConfig], Quantiza
         cache: Optional[List[KeyValueCache]] = None,
         positions: Optional[Tensor] = None,
         store_cache: bool = False,
+        store_hidden_states: bool = True,
+        last_step_logits_only: bool = False,
     ) -> CausalLMOutputWithCache[KeyValueCache]:
         # TODO: remove this forward method once we support weight tying.
 
@@ -71,13 +73,20 @@ class MPTCausalLM(TransformerCausalLM[MPTConfig], FromHFHub[MPTConfig], Quantiza
             attention_mask,
             cache=cache,
             store_cache=store_cache,
+            store_hidden_states=store_hidden_states,
             positions=positions,
         )
 
         assert isinstance(self.decoder.embeddings.piece_embeddings, Embedding)
         output_embeddings = self.decoder.embeddings.piece_embeddings.weight
 
-        logits = F.linear(decoder_output.last_hidden_layer_state, output_embeddings)
+        last_hidden_layer_state = decoder_output.last_hidden_layer_state
+        if last_step_logits_only:
+            # Slice before the output projection, so that the logits of
+            # the preceding steps are never materialized.
+            last_hidden_layer_state = last_hidden_layer_state[:, -1:, :]
+
+        logits = F.linear(last_hidden_layer_state, output_embeddings)
         return CausalLMOutputWithCache(
             all_outputs=decoder_output.all_outputs,
             cache=decoder_output.cache,
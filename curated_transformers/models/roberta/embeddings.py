@@ -10,6 +10,16 @@ from ...layers.transformer import (
 )
 
 
+@torch.jit.script
+def _positions_from_padding(x: Tensor, padding_id: int) -> Tensor:
+    # Compute the padding mask and the positions in one pass, reusing the
+    # cumulative sum buffer for the remaining pointwise operations. This
+    # avoids materializing separate tensors for the mask conversion and
+    # each pointwise step.
+    mask = x.ne(padding_id)
+    return mask.cumsum(dim=1).mul_(mask).add_(padding_id)
+
+
 class RoBERTaEmbeddings(TransformerEmbeddings):
     """
     RoBERTa (`Liu et al., 2019`_) embedding layer.
@@ -83,8 +93,7 @@ class RoBERTaEmbeddings(TransformerEmbeddings):
         # input tensor to pass to the embedding layer and
         # handle padding, c.f https://github.com/huggingface/transformers/blob/330247ede2d8265aae9ab0b7a0d1a811c344960d/src/transformers/models/roberta/modeling_roberta.py#L1566
 
-        mask = x.ne(self.padding_id).int()
-        return (mask.cumsum(dim=1) * mask) + self.padding_id
+        return _positions_from_padding(x, self.padding_id)
 
     def forward(
         self,
@@ -1,9 +1,10 @@
-from typing import Generic, List, Optional
+from typing import Callable, Generic, List, Optional, Tuple
 
 import torch
 from torch import Tensor
 from torch.nn import Module, ModuleList
 
+from .._compat import has_torch_compile
 from ..layers.attention import AttentionMask
 from ..layers.cache import KeyValueCache
 from .module import CausalLMModule, ConfigT, DecoderModule, EncoderModule
@@ -24,6 +25,58 @@ class TransformerDecoder(Generic[ConfigT], DecoderModule[ConfigT, KeyValueCache]
     layers: ModuleList
     output_layer_norm: Module
 
+    def __init__(self, config: ConfigT):
+        super().__init__(config)
+
+        self._layer_runner: Optional[
+            Callable[..., Tuple[List[Tensor], Optional[List[KeyValueCache]]]]
+        ] = None
+
+    def compile_layers(
+        self,
+        *,
+        backend: str = "inductor",
+        dynamic: Optional[bool] = None,
+        fullgraph: bool = False,
+        mode: Optional[str] = "reduce-overhead",
+    ) -> None:
+        """
+        Compile the hidden layer stack using ``torch.compile``.
+
+        The hidden layers are compiled as one unit, removing the per-layer
+        operator dispatch overhead of the eager layer loop. This is
+        particularly beneficial for decoding, where the layers process a
+        single token per step. The default ``reduce-overhead`` mode
+        additionally captures the decoding step in a CUDA Graph (when
+        decoding on a CUDA device), replacing the many small kernel
+        launches of a step by a single graph replay.
+
+        :param backend:
+            Compilation backend.
+        :param dynamic:
+            Whether to use dynamic shape tracing.
+        :param fullgraph:
+            Whether to require that the layer stack is compiled as a
+            single graph. Cache updates cannot always be captured in
+            one graph, so this is disabled by default.
+        :param mode:
+            Compilation mode.
+        """
+        if not has_torch_compile:
+            raise ValueError(
+                "Compilation of the hidden layers requires `torch.compile`, "
+                "which is not supported by the installed version of PyTorch "
+                "or the current platform."
+            )
+
+        self._layer_runner = torch.compile(
+            self._run_layers,
+            backend=backend,
+            dynamic=dynamic,
+            fullgraph=fullgraph,
+            mode=mode,
+        )
+
     def forward(
         self,
         piece_ids: Tensor,
@@ -32,9 +85,38 @@ class TransformerDecoder(Generic[ConfigT], DecoderModule[ConfigT, KeyValueCache]
         cache: Optional[List[KeyValueCache]] = None,
         positions: Optional[Tensor] = None,
         store_cache: bool = False,
+        store_hidden_states: bool = True,
     ) -> ModelOutputWithCache[KeyValueCache]:
         embeddings = self.embeddings(piece_ids)
-        layer_output = embeddings
+
+        layer_runner = self._layer_runner
+        if layer_runner is None:
+            layer_runner = self._run_layers
+        layer_outputs, new_cache = layer_runner(
+            embeddings,
+            attention_mask,
+            cache=cache,
+            positions=positions,
+            store_cache=store_cache,
+            store_hidden_states=store_hidden_states,
+        )
+
+        return ModelOutputWithCache(
+            all_outputs=[embeddings, *layer_outputs],
+            cache=new_cache,
+        )
+
+    def _run_layers(
+        self,
+        hidden: Tensor,
+        attention_mask: AttentionMask,
+        *,
+        cache: Optional[List[KeyValueCache]] = None,
+        positions: Optional[Tensor] = None,
+        store_cache: bool = False,
+        store_hidden_states: bool = True,
+    ) -> Tuple[List[Tensor], Optional[List[KeyValueCache]]]:
+        layer_output = hidden
 
         layer_outputs = []
         new_cache = []
@@ -52,16 +134,18 @@ class TransformerDecoder(Generic[ConfigT], DecoderModule[ConfigT, KeyValueCache]
                 store_cache=store_cache,
                 positions=positions,
             )
-            layer_outputs.append(layer_output)
+            if store_hidden_states:
+                layer_outputs.append(layer_output)
             if store_cache:
                 new_cache.append(new_layer_cache)
 
-        layer_outputs[-1] = self.output_layer_norm(layer_outputs[-1])
+        layer_output = self.output_layer_norm(layer_output)
+        if store_hidden_states:
+            layer_outputs[-1] = layer_output
+        else:
+            layer_outputs = [layer_output]
 
-        return ModelOutputWithCache(
-            all_outputs=[embeddings, *layer_outputs],
-            cache=new_cache if store_cache else None,
-        )
+        return layer_outputs, new_cache if store_cache else None
 
 
 class TransformerCausalLM(Generic[ConfigT], CausalLMModule[ConfigT, KeyValueCache]):
@@ -84,15 +168,23 @@ class TransformerCausalLM(Generic[ConfigT], CausalLMModule[ConfigT, KeyValueCach
         cache: Optional[List[KeyValueCache]] = None,
         positions: Optional[Tensor] = None,
         store_cache: bool = False,
+        store_hidden_states: bool = True,
+        last_step_logits_only: bool = False,
     ) -> CausalLMOutputWithCache[KeyValueCache]:
         decoder_output = self.decoder(
             piece_ids,
             attention_mask,
             cache=cache,
             store_cache=store_cache,
+            store_hidden_states=store_hidden_states,
             positions=positions,
         )
-        logits = self.output_embeddings(decoder_output.last_hidden_layer_state)
+        last_hidden_layer_state = decoder_output.last_hidden_layer_state
+        if last_step_logits_only:
+            # Slice before the output projection, so that the logits of
+            # the preceding steps are never materialized.
+            last_hidden_layer_state = last_hidden_layer_state[:, -1:, :]
+        logits = self.output_embeddings(last_hidden_layer_state)
         return CausalLMOutputWithCache(
             all_outputs=decoder_output.all_outputs,
             cache=decoder_output.cache,
@@ -113,6 +205,52 @@ class TransformerEncoder(Generic[ConfigT], EncoderModule[ConfigT]):
     embeddings: Module
     layers: ModuleList
 
+    def __init__(self, config: ConfigT):
+        super().__init__(config)
+
+        self._layer_runner: Optional[Callable[..., List[Tensor]]] = None
+
+    def compile_layers(
+        self,
+        *,
+        backend: str = "inductor",
+        dynamic: Optional[bool] = None,
+        fullgraph: bool = True,
+        mode: Optional[str] = None,
+    ) -> None:
+        """
+        Compile the hidden layer stack using ``torch.compile``.
+
+        The hidden layers are compiled as a single graph, removing the
+        per-layer operator dispatch overhead of the eager layer loop.
+        This is particularly beneficial for small batch sizes, where the
+        encoder is dispatch-bound.
+
+        :param backend:
+            Compilation backend.
+        :param dynamic:
+            Whether to use dynamic shape tracing.
+        :param fullgraph:
+            Whether to require that the layer stack is compiled as a
+            single graph.
+        :param mode:
+            Compilation mode, e.g. ``reduce-overhead``.
+        """
+        if not has_torch_compile:
+            raise ValueError(
+                "Compilation of the hidden layers requires `torch.compile`, "
+                "which is not supported by the installed version of PyTorch "
+                "or the current platform."
+            )
+
+        self._layer_runner = torch.compile(
+            self._run_layers,
+            backend=backend,
+            dynamic=dynamic,
+            fullgraph=fullgraph,
+            mode=mode,
+        )
+
     def forward(
         self,
         piece_ids: Tensor,
@@ -120,13 +258,35 @@ class TransformerEncoder(Generic[ConfigT], EncoderModule[ConfigT]):
         *,
         positions: Optional[Tensor] = None,
         type_ids: Optional[Tensor] = None,
+        store_hidden_states: bool = True,
     ) -> ModelOutput:
         embeddings = self.embeddings(piece_ids, positions=positions, type_ids=type_ids)
-        layer_output = embeddings
+
+        layer_runner = self._layer_runner
+        if layer_runner is None:
+            layer_runner = self._run_layers
+        layer_outputs = layer_runner(
+            embeddings, attention_mask, store_hidden_states=store_hidden_states
+        )
+
+        return ModelOutput(all_outputs=[embeddings, *layer_outputs])
+
+    def _run_layers(
+        self,
+        hidden: Tensor,
+        attention_mask: AttentionMask,
+        *,
+        store_hidden_states: bool = True,
+    ) -> List[Tensor]:
+        layer_output = hidden
 
         layer_outputs = []
         for layer in self.layers:
             layer_output, _ = layer(layer_output, attention_mask)
-            layer_outputs.append(layer_output)
+            if store_hidden_states:
+                layer_outputs.append(layer_output)
 
-        return ModelOutput(all_outputs=[embeddings, *layer_outputs])
+        if not store_hidden_states:
+            layer_outputs = [layer_output]
+
+        return layer_outputs
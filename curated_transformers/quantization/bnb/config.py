@@ -42,12 +42,23 @@ class _8BitConfig:
 class BitsAndBytesConfig:
     """
     Configuration for quantization using the ``bitsandbytes`` library.
+
+    :param quantize_output_embeddings:
+        If the output embeddings (the language modeling head) should be
+        quantized as well. Models exclude the output embeddings from
+        quantization by default, but quantizing them halves the memory
+        bandwidth of the output projection during decoding.
     """
 
     inner: Union[_4BitConfig, _8BitConfig]
+    quantize_output_embeddings: bool = False
 
     @staticmethod
-    def for_8bit(outlier_threshold: float = 6.0, finetunable: bool = False):
+    def for_8bit(
+        outlier_threshold: float = 6.0,
+        finetunable: bool = False,
+        quantize_output_embeddings: bool = False,
+    ):
         """
         Construct a configuration for ``int8`` quantization.
 
@@ -57,9 +68,12 @@ class BitsAndBytesConfig:
         :param finetunable:
             If the quantized model should support fine-tuning after
             quantization.
+        :param quantize_output_embeddings:
+            If the output embeddings should be quantized as well.
         """
         return BitsAndBytesConfig(
-            _8BitConfig(finetunable=finetunable, outlier_threshold=outlier_threshold)
+            _8BitConfig(finetunable=finetunable, outlier_threshold=outlier_threshold),
+            quantize_output_embeddings=quantize_output_embeddings,
         )
 
     @staticmethod
@@ -67,10 +81,15 @@ class BitsAndBytesConfig:
         quantization_dtype: Dtype4Bit = Dtype4Bit.FP4,
         compute_dtype: torch.dtype = torch.bfloat16,
         double_quantization: bool = True,
+        quantize_output_embeddings: bool = False,
     ):
         """
         Construct a configuration for ``fp4``/``nf4`` quantization.
 
+        Only the weights of the ``Linear`` layers are quantized. Other
+        modules, such as embeddings and layer norms, are stored in the
+        compute dtype.
+
         :param quantization_dtype:
             Data type used for storing quantized weights.
         :param compute_dtype:
@@ -79,6 +98,8 @@ class BitsAndBytesConfig:
         :param double_quantization:
             If the quantization constants should themselves be
             quantized.
+        :param quantize_output_embeddings:
+            If the output embeddings should be quantized as well.
         """
         supported_compute_dtypes = (torch.float32, torch.float16, torch.bfloat16)
         if compute_dtype not in supported_compute_dtypes:
@@ -91,5 +112,6 @@ class BitsAndBytesConfig:
                 quantization_dtype=quantization_dtype,
                 compute_dtype=compute_dtype,
                 double_quantization=double_quantization,
-            )
+            ),
+            quantize_output_embeddings=quantize_output_embeddings,
         )
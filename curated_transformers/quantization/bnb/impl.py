@@ -37,9 +37,16 @@ def prepare_for_quantization(
     """
     _assert_bitsandbytes_installed()
 
-    # All inputs to quantized layers need to be of type `float16`.
-    # TODO How do we exclude non-quantizable modules from this?
-    module.to(torch.float16)
+    if isinstance(config.inner, _4BitConfig):
+        # Only the linear weights are quantized. Modules that are excluded
+        # from quantization (embeddings, layer norms) are kept in the
+        # compute dtype, which is also the dtype that the quantized layers
+        # expect for their inputs.
+        module.to(config.inner.compute_dtype)
+    else:
+        # All inputs to `int8` quantized layers need to be of type `float16`.
+        # TODO How do we exclude non-quantizable modules from this?
+        module.to(torch.float16)
 
     if isinstance(config.inner, _8BitConfig):
         _replace_quantizable_modules(
@@ -107,13 +114,26 @@ def _convert_tensor_to_quantized_parameter(
 
     # Bias is stored as a regular, non-quantized parameter.
     is_bias_param = parameter_name == "bias"
-    # All parameters need to be of dtype `float16` for quantization.
-    tensor = tensor.to(torch.float16)
 
     is_8bit = isinstance(module, bnb.nn.Linear8bitLt)
     is_4bit = isinstance(module, bnb.nn.Linear4bit)
     is_non_quantized = not is_8bit and not is_4bit
 
+    if is_4bit:
+        # Non-quantized tensors of 4-bit layers (such as biases) are stored
+        # in the compute dtype, which is also the dtype that weights are
+        # dequantized to.
+        compute_dtype: torch.dtype = module.compute_dtype  # type: ignore[assignment]
+        tensor = tensor.to(compute_dtype)
+    elif is_non_quantized:
+        # Modules that are excluded from quantization keep the dtype that
+        # the model was prepared with.
+        tensor = tensor.to(old_param.dtype)
+    else:
+        # All parameters need to be of dtype `float16` for `int8`
+        # quantization.
+        tensor = tensor.to(torch.float16)
+
     if is_bias_param or is_non_quantized:
         new_param = Parameter(tensor, requires_grad=old_param.requires_grad)
     elif is_8bit:
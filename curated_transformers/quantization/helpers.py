@@ -27,5 +27,9 @@ def prepare_module_for_quantization(
         raise ValueError(f"Module of type `{type(module)}` is not quantizable")
     qmodel: Quantizable = module
     non_quantizable_module_prefixes = qmodel.modules_to_not_quantize()
+    if config.quantize_output_embeddings:
+        non_quantizable_module_prefixes = non_quantizable_module_prefixes - {
+            "output_embeddings"
+        }
 
     return bnb_prepare_for_quantization(module, config, non_quantizable_module_prefixes)
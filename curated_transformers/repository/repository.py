@@ -85,6 +85,8 @@ class ModelRepository(Repository):
     with repositories that contain a model.
     """
 
+    repo: Repository
+
     # Cached model configuration.
     _model_config: Optional[Dict[str, Any]]
 
@@ -93,11 +95,17 @@ class ModelRepository(Repository):
         Construct a model repository wrapper.
 
         :param repo:
-            The repository to wrap.
+            The repository to wrap. When the repository is itself a
+            model repository wrapper, its cached model configuration
+            is reused.
         """
         super().__init__()
-        self.repo = repo
-        self._model_config = None
+        if isinstance(repo, ModelRepository):
+            self.repo = repo.repo
+            self._model_config = repo._model_config
+        else:
+            self.repo = repo
+            self._model_config = None
 
     def file(self, filename: str) -> RepositoryFile:
         return self.repo.file(filename)
@@ -0,0 +1,54 @@
+import pytest
+import torch
+
+from curated_transformers.layers.cache import KeyValueCache, PagedKeyValueCache
+
+from ..conftest import TORCH_DEVICES
+from ..utils import torch_assertclose
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_paged_cache_append_equals_dense(torch_device):
+    torch.manual_seed(0)
+
+    key = torch.randn(2, 4, 5, 8, device=torch_device)
+    value = torch.randn(2, 4, 5, 8, device=torch_device)
+    paged = PagedKeyValueCache.from_key_value(key, value)
+    dense = KeyValueCache(key, value)
+
+    torch_assertclose(paged.key, dense.key)
+    torch_assertclose(paged.value, dense.value)
+
+    # Append enough steps to cross a block boundary.
+    for _ in range(20):
+        step_key = torch.randn(2, 4, 1, 8, device=torch_device)
+        step_value = torch.randn(2, 4, 1, 8, device=torch_device)
+        paged = paged.append(step_key, step_value)
+        dense = dense.append(step_key, step_value)
+
+    torch_assertclose(paged.key, dense.key)
+    torch_assertclose(paged.value, dense.value)
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_paged_cache_filter_batch_items(torch_device):
+    torch.manual_seed(0)
+
+    key = torch.randn(3, 4, 5, 8, device=torch_device)
+    value = torch.randn(3, 4, 5, 8, device=torch_device)
+    paged = PagedKeyValueCache.from_key_value(key, value)
+
+    mask = torch.tensor([True, False, True], device=torch_device)
+    filtered = paged.filter_batch_items(mask)
+    assert isinstance(filtered, PagedKeyValueCache)
+    torch_assertclose(filtered.key, key[mask])
+    torch_assertclose(filtered.value, value[mask])
+
+    # Filtered caches must still support appends.
+    step_key = torch.randn(2, 4, 1, 8, device=torch_device)
+    step_value = torch.randn(2, 4, 1, 8, device=torch_device)
+    filtered = filtered.append(step_key, step_value)
+    torch_assertclose(filtered.key[:, :, -1:, :], step_key)
+
+    with pytest.raises(ValueError, match="batch size"):
+        filtered.filter_batch_items(torch.tensor([True], device=torch_device))
@@ -2,6 +2,7 @@ import pytest
 import torch
 
 from curated_transformers.layers.embeddings import (
+    QuantizedEmbedding,
     RotaryEmbeddings,
     SinusoidalPositionalEmbedding,
 )
@@ -171,3 +172,30 @@ def test_sinusoidal_embeddings_with_norm():
             ]
         ),
     )
+
+
+@pytest.mark.parametrize("device", TORCH_DEVICES)
+def test_quantized_embedding(device):
+    torch.manual_seed(0)
+
+    embeddings = torch.nn.Embedding(32, 16, padding_idx=1, device=device)
+    with torch.no_grad():
+        embeddings.weight[embeddings.padding_idx] = 0.0
+    quantized = QuantizedEmbedding(embeddings)
+
+    assert quantized.weight.dtype == torch.int8
+
+    ids = torch.randint(0, 32, (4, 8), device=device)
+    with torch.no_grad():
+        Y = quantized(ids)
+        Y_ref = embeddings(ids)
+
+    assert Y.dtype == Y_ref.dtype
+    # Quantization error is bounded by half a quantization step per row.
+    max_err = (embeddings.weight.abs().amax(dim=1) / 254.0).amax()
+    assert (Y - Y_ref).abs().max() <= max_err
+
+    # The padding row must dequantize to exact zeros.
+    padding = torch.full((1, 2), embeddings.padding_idx, device=device)
+    with torch.no_grad():
+        assert quantized(padding).eq(0.0).all()
@@ -0,0 +1,44 @@
+import pytest
+import torch
+from torch.nn import SiLU
+
+from curated_transformers.layers.feedforward import PointwiseFeedForward
+
+from ..conftest import TORCH_DEVICES
+from ..utils import torch_assertclose
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+@pytest.mark.parametrize("use_bias", [False, True])
+def test_fuse_gate(torch_device, use_bias):
+    torch.manual_seed(0)
+
+    ffn = PointwiseFeedForward(
+        activation=SiLU(),
+        hidden_width=16,
+        intermediate_width=32,
+        use_bias=use_bias,
+        use_gate=True,
+        device=torch_device,
+    )
+    ffn.eval()
+
+    X = torch.randn(2, 5, 16, device=torch_device)
+    with torch.no_grad():
+        Y = ffn(X)
+        ffn.fuse_gate()
+        Y_fused = ffn(X)
+
+    torch_assertclose(Y, Y_fused)
+
+
+def test_fuse_gate_rejects_ungated():
+    ffn = PointwiseFeedForward(
+        activation=SiLU(),
+        hidden_width=16,
+        intermediate_width=32,
+        use_bias=False,
+        use_gate=False,
+    )
+    with pytest.raises(ValueError, match="without gating"):
+        ffn.fuse_gate()
@@ -0,0 +1,87 @@
+import pytest
+import torch
+
+from curated_transformers.layers.attention import AttentionMask
+from curated_transformers.models.bert import BERTConfig, BERTEncoder
+from curated_transformers.models.llama import LlamaConfig, LlamaDecoder
+
+from ..compat import has_torch_compile
+from ..conftest import TORCH_DEVICES
+from ..utils import torch_assertclose
+
+
+def _small_bert_encoder(device):
+    config = BERTConfig()
+    config.embedding.embedding_width = 32
+    config.embedding.hidden_width = 32
+    config.layer.feedforward.hidden_width = 32
+    config.layer.feedforward.intermediate_width = 64
+    config.layer.attention.hidden_width = 32
+    config.layer.attention.n_query_heads = 4
+    config.layer.attention.n_key_value_heads = 4
+    config.layer.n_hidden_layers = 2
+    return BERTEncoder(config, device=device)
+
+
+def _small_llama_decoder(device):
+    config = LlamaConfig(
+        hidden_width=32,
+        intermediate_width=64,
+        n_query_heads=4,
+        n_key_value_heads=4,
+        n_hidden_layers=2,
+        n_pieces=128,
+    )
+    return LlamaDecoder(config, device=device)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not has_torch_compile, reason="requires torch.compile")
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_encoder_layers_compile_as_single_graph(torch_device):
+    torch.manual_seed(0)
+
+    encoder = _small_bert_encoder(torch_device).eval()
+    piece_ids = torch.randint(0, 100, (2, 6), device=torch_device)
+    mask = AttentionMask(
+        torch.tensor(
+            [[True] * 6, [True] * 4 + [False] * 2],
+            device=torch_device,
+        )
+    )
+
+    with torch.no_grad():
+        embeddings = encoder.embeddings(piece_ids, positions=None, type_ids=None)
+        explanation = torch._dynamo.explain(encoder._run_layers)(embeddings, mask)
+        assert explanation.graph_break_count == 0
+
+        output = encoder(piece_ids, mask)
+        # `fullgraph` requires that the layer stack compiles as one graph.
+        encoder.compile_layers(fullgraph=True)
+        output_compiled = encoder(piece_ids, mask)
+
+    torch_assertclose(output_compiled.all_outputs[-1], output.all_outputs[-1])
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not has_torch_compile, reason="requires torch.compile")
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_decoder_layers_compile_as_single_graph(torch_device):
+    torch.manual_seed(0)
+
+    decoder = _small_llama_decoder(torch_device).eval()
+    piece_ids = torch.randint(0, 128, (2, 6), device=torch_device)
+    mask = AttentionMask(torch.ones(2, 6, dtype=torch.bool, device=torch_device))
+
+    with torch.no_grad():
+        embeddings = decoder.embeddings(piece_ids)
+        explanation = torch._dynamo.explain(decoder._run_layers)(embeddings, mask)
+        assert explanation.graph_break_count == 0
+
+        output = decoder(piece_ids, mask)
+        decoder.compile_layers(fullgraph=True, mode=None)
+        output_compiled = decoder(piece_ids, mask)
+
+    torch_assertclose(
+        output_compiled.last_hidden_layer_state, output.last_hidden_layer_state
+    )
@@ -71,6 +71,7 @@ class FairSeqPreDecoder(PreDecoder):
         self.bos_id = bos_id
         self.eos_id = eos_id
         self.piece_updater = piece_updater
+        self._pieces_to_remove = frozenset((bos_id, eos_id))
 
     def __call__(self, input: Iterable[Iterable[int]]) -> List[List[int]]:
         # Revert the fairseq alignment.
@@ -80,6 +81,5 @@ class FairSeqPreDecoder(PreDecoder):
         )
 
         return [
-            list(remove_pieces_from_sequence(ids, (self.bos_id, self.eos_id)))
-            for ids in input
+            remove_pieces_from_sequence(ids, self._pieces_to_remove) for ids in input
         ]
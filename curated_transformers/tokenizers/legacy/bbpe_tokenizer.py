@@ -22,9 +22,10 @@ class ByteBPETokenizer(LegacyTokenizer):
     def __init__(
         self,
         *,
-        vocab: Dict[str, int],
-        merges: List[Tuple[str, str]],
+        vocab: Optional[Dict[str, int]] = None,
+        merges: Optional[List[Tuple[str, str]]] = None,
         special_pieces: Optional[Dict[str, int]] = None,
+        processor: Optional[ByteBPEProcessor] = None,
     ):
         """
         Construct a byte BPE tokenizer.
@@ -35,11 +36,37 @@ class ByteBPETokenizer(LegacyTokenizer):
             Merges.
         :param special_pieces:
             Special pieces.
+        :param processor:
+            Preconstructed byte BPE processor. Constructing the tokenizer
+            from a processor avoids round-tripping the vocabulary and the
+            merges through Python data structures. Mutually exclusive with
+            ``vocab`` and ``merges``.
         """
         self.special_piece_to_id = {} if special_pieces is None else special_pieces
         self.id_to_special_piece = {v: k for k, v in self.special_piece_to_id.items()}
-        vocab.update(self.special_piece_to_id)
-        self.processor = ByteBPEProcessor(vocab, merges)
+        if processor is not None:
+            if vocab is not None or merges is not None:
+                raise ValueError(
+                    "Byte BPE tokenizer expects either a processor or a "
+                    "vocabulary with merges, both were provided"
+                )
+            # A preconstructed processor cannot be extended, so the special
+            # pieces must already be part of its vocabulary.
+            for piece, piece_id in self.special_piece_to_id.items():
+                if processor.piece_to_id(piece) != piece_id:
+                    raise ValueError(
+                        f"Special piece '{piece}' is not in the vocabulary of "
+                        "the byte BPE processor"
+                    )
+        else:
+            if vocab is None or merges is None:
+                raise ValueError(
+                    "Byte BPE tokenizer expects a processor or a vocabulary "
+                    "with merges, neither was provided"
+                )
+            vocab.update(self.special_piece_to_id)
+            processor = ByteBPEProcessor(vocab, merges)
+        self.processor = processor
 
     def piece_to_id(self, piece: str) -> Optional[int]:
         return self.processor.token_to_id(piece)
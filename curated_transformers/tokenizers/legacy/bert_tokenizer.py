@@ -1,4 +1,5 @@
 import unicodedata
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Type, TypeVar
 
 from curated_tokenizers import WordPieceProcessor
@@ -36,6 +37,22 @@ TOKENIZER_CONFIG_MAPPING: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _is_punctuation(char: str) -> bool:
+    # ASCII punctuation from HF tranformers, since we need to split
+    # in the same way.
+    cp = ord(char)
+    if (
+        (cp >= 33 and cp <= 47)
+        or (cp >= 58 and cp <= 64)
+        or (cp >= 91 and cp <= 96)
+        or (cp >= 123 and cp <= 126)
+    ):
+        return True
+
+    return unicodedata.category(char).startswith("P")
+
+
 class BERTPreEncoder(PreEncoder):
     def __init__(
         self,
@@ -60,37 +77,24 @@ class BERTPreEncoder(PreEncoder):
         'AWO-Mitarbeiter' is split into ['AWO', '-', 'Mitarbeiter'].
         """
         tokens = []
-        in_word = False
-        while token:
-            char = token[0]
-            token = token[1:]
+        word_start = -1
+        for idx, char in enumerate(token):
             if self.is_punctuation(char):
-                tokens.append([char])
-                in_word = False
-            else:
-                if in_word:
-                    tokens[-1].append(char)
-                else:
-                    tokens.append([char])
-                    in_word = True
-        return ["".join(t) for t in tokens]
+                if word_start >= 0:
+                    tokens.append(token[word_start:idx])
+                    word_start = -1
+                tokens.append(char)
+            elif word_start < 0:
+                word_start = idx
+        if word_start >= 0:
+            tokens.append(token[word_start:])
+        return tokens
 
     def is_punctuation(self, char: str) -> bool:
         """
         Checks whether `char` is a punctuation character.
         """
-        # ASCII punctuation from HF tranformers, since we need to split
-        # in the same way.
-        cp = ord(char)
-        if (
-            (cp >= 33 and cp <= 47)
-            or (cp >= 58 and cp <= 64)
-            or (cp >= 91 and cp <= 96)
-            or (cp >= 123 and cp <= 126)
-        ):
-            return True
-
-        return unicodedata.category(char).startswith("P")
+        return _is_punctuation(char)
 
     def __call__(self, input: Iterable[InputChunks]) -> List[InputChunks]:
         preprocessed = []
@@ -129,11 +133,11 @@ class BERTPreDecoder(PreDecoder):
         """
         self.bos_id = bos_id
         self.eos_id = eos_id
+        self._pieces_to_remove = frozenset((bos_id, eos_id))
 
     def __call__(self, input: Iterable[Iterable[int]]) -> List[List[int]]:
         return [
-            list(remove_pieces_from_sequence(ids, (self.bos_id, self.eos_id)))
-            for ids in input
+            remove_pieces_from_sequence(ids, self._pieces_to_remove) for ids in input
         ]
 
 
@@ -1,3 +1,5 @@
+import os
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from curated_tokenizers import ByteBPEProcessor
@@ -29,11 +31,11 @@ class RoBERTaPreDecoder(PreDecoder):
         """
         self.bos_id = bos_id
         self.eos_id = eos_id
+        self._pieces_to_remove = frozenset((bos_id, eos_id))
 
     def __call__(self, input: Iterable[Iterable[int]]) -> List[List[int]]:
         return [
-            list(remove_pieces_from_sequence(ids, (self.bos_id, self.eos_id)))
-            for ids in input
+            remove_pieces_from_sequence(ids, self._pieces_to_remove) for ids in input
         ]
 
 
@@ -49,9 +51,10 @@ class RoBERTaTokenizer(ByteBPETokenizer, LegacyFromHFHub):
     def __init__(
         self,
         *,
-        vocab: Dict[str, int],
-        merges: List[Tuple[str, str]],
+        vocab: Optional[Dict[str, int]] = None,
+        merges: Optional[List[Tuple[str, str]]] = None,
         special_pieces: Optional[Dict[str, int]] = None,
+        processor: Optional[ByteBPEProcessor] = None,
         bos_piece: str = "<s>",
         eos_piece: str = "</s>",
     ):
@@ -64,12 +67,20 @@ class RoBERTaTokenizer(ByteBPETokenizer, LegacyFromHFHub):
             Merges.
         :param special_pieces:
             Special pieces.
+        :param processor:
+            Preconstructed byte BPE processor. Mutually exclusive with
+            ``vocab`` and ``merges``.
         :param bos_piece:
             Beginning of sequence piece.
         :param eos_piece:
             End of sequence piece.
         """
-        super().__init__(vocab=vocab, merges=merges, special_pieces=special_pieces)
+        super().__init__(
+            vocab=vocab,
+            merges=merges,
+            special_pieces=special_pieces,
+            processor=processor,
+        )
 
         bos_id = _get_piece_id_or_fail(self.processor, bos_piece)
         eos_id = _get_piece_id_or_fail(self.processor, eos_piece)
@@ -104,14 +115,29 @@ class RoBERTaTokenizer(ByteBPETokenizer, LegacyFromHFHub):
         :param eos_piece:
             The piece to use to mark the end of a sequence.
         """
-        with vocab_file.open(mode="r", encoding="utf-8") as vocab:
-            with merges_file.open(mode="r", encoding="utf-8") as merges:
-                processor = ByteBPEProcessor.load_from_files(vocab=vocab, merges=merges)
+        # Fall back to file objects for repository files that are not
+        # available as local paths (and path-like objects).
+        vocab_path = getattr(vocab_file, "path", None)
+        merges_path = getattr(merges_file, "path", None)
+        if vocab_path is not None and merges_path is not None:
+            # Byte BPE processors are immutable, so tokenizers that are
+            # constructed from the same files can share one processor.
+            processor = _load_processor_from_paths(
+                os.path.realpath(vocab_path),
+                os.stat(vocab_path).st_mtime_ns,
+                os.path.realpath(merges_path),
+                os.stat(merges_path).st_mtime_ns,
+            )
+        else:
+            with vocab_file.open(mode="r", encoding="utf-8") as vocab:
+                with merges_file.open(mode="r", encoding="utf-8") as merges:
+                    processor = ByteBPEProcessor.load_from_files(
+                        vocab=vocab, merges=merges
+                    )
         return cls(
-            # This is a bit annoying, but we want to avoid these extremely
-            # overloaded constructors.
-            vocab=processor.vocab,
-            merges=processor.merges,
+            # Pass the processor as-is, so that the vocabulary and the
+            # merges are not round-tripped through Python data structures.
+            processor=processor,
             bos_piece=bos_piece,
             eos_piece=eos_piece,
         )
@@ -132,6 +158,20 @@ class RoBERTaTokenizer(ByteBPETokenizer, LegacyFromHFHub):
         )
 
 
+@lru_cache(maxsize=4)
+def _load_processor_from_paths(
+    vocab_path: str,
+    vocab_mtime_ns: int,
+    merges_path: str,
+    merges_mtime_ns: int,
+) -> ByteBPEProcessor:
+    # The modification times are part of the cache key, so that a processor
+    # is not reused when the files have changed in the meantime.
+    with open(vocab_path, mode="r", encoding="utf-8") as vocab:
+        with open(merges_path, mode="r", encoding="utf-8") as merges:
+            return ByteBPEProcessor.load_from_files(vocab=vocab, merges=merges)
+
+
 def _get_piece_id_or_fail(processor: ByteBPEProcessor, piece: str):
     piece_id = processor.piece_to_id(piece)
     if piece_id is None:
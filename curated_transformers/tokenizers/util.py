@@ -1,7 +1,7 @@
-from typing import Iterable, Tuple
+from typing import Container, Iterable, List
 
 
 def remove_pieces_from_sequence(
-    input: Iterable[int], pieces_to_remove: Tuple[int, ...]
-) -> Iterable[int]:
-    return (piece for piece in input if piece not in pieces_to_remove)
+    input: Iterable[int], pieces_to_remove: Container[int]
+) -> List[int]:
+    return [piece for piece in input if piece not in pieces_to_remove]